@@ -11,7 +11,7 @@ Características:
 
 from __future__ import annotations
 
-import io
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -28,23 +28,76 @@ from reportlab.platypus import (
     PageBreak,
 )
 
-from src.utils import formatar_total_previdencia, safe_str, converter_valor_br_para_float, to_float_ptbr
+from src.utils import formatar_moeda_br, formatar_total_previdencia, safe_str, converter_valor_br_para_float, to_float_ptbr
 from reportlab.pdfgen import canvas as rl_canvas
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Caminho do papel timbrado resolvido uma única vez no import (evita stat() por geração)
+_TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "assets" / "nota_explicativa_em_branco.png"
+_TEMPLATE_PATH_STR = str(_TEMPLATE_PATH) if _TEMPLATE_PATH.exists() else None
+
+# Estilos imutáveis construídos uma vez por processo (não por relatório)
+_STYLES = getSampleStyleSheet()
+_NORMAL = _STYLES["Normal"]
+_NORMAL.spaceAfter = 4
+
+_HEADING = ParagraphStyle(
+    "Heading",
+    parent=_STYLES["Heading2"],
+    fontName="Helvetica-Bold",
+    fontSize=12,
+    spaceBefore=10,
+    spaceAfter=4,
+)
+
+_HEADING3 = ParagraphStyle(
+    "Heading3",
+    parent=_STYLES["Heading3"],
+    fontName="Helvetica-Bold",
+    fontSize=11,
+    spaceBefore=8,
+    spaceAfter=4,
+)
+
+
+class _BAWriter:
+    """Destino de escrita mínimo para o ReportLab, acumulando em bytearray.
+
+    Implementa somente o que o doc.build usa (write/tell/seek), sem o
+    bookkeeping de posição do BytesIO; o resultado final sai com uma
+    única cópia via bytes(ba).
+    """
+
+    __slots__ = ("ba",)
+
+    def __init__(self):
+        self.ba = bytearray()
+
+    def write(self, b):
+        self.ba.extend(b)
+        return len(b)
+
+    def tell(self):
+        return len(self.ba)
+
+    def seek(self, *args, **kwargs):
+        pass
+
+    def flush(self):
+        pass
+
 
 # ==============================================================================
 # HELPERS DE FORMATAÇÃO
 # ==============================================================================
 def _fmt_moeda(valor) -> str:
-    """Formata float ou str numérico para R$ X.XXX,XX"""
+    """Formata float ou str numérico para R$ X.XXX,XX (delega em formatar_moeda_br)."""
     if not valor:
         return "-"
     try:
-        val_float = float(valor)
-        return f"R$ {val_float:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        return formatar_moeda_br(float(valor))
     except (ValueError, TypeError):
         return str(valor)
 
@@ -55,6 +108,11 @@ class PDFTemplate(SimpleDocTemplate):
     def __init__(self, *args, template_path=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.template_path = template_path
+        # ImageReader criado uma vez; o desenho por página só reutiliza
+        try:
+            self._img_reader = ImageReader(str(template_path)) if template_path else None
+        except Exception:
+            self._img_reader = None
 
     def build(
         self,
@@ -84,49 +142,57 @@ class PDFTemplate(SimpleDocTemplate):
         )
 
     def _draw_letterhead(self, canvas, doc):
-        if self.template_path and Path(self.template_path).exists():
-            try:
-                img_reader = ImageReader(str(self.template_path))
-                canvas.saveState()
-                canvas.drawImage(
-                    img_reader,
-                    0,
-                    0,
-                    width=self.pagesize[0],
-                    height=self.pagesize[1],
-                    preserveAspectRatio=False,
-                    mask=None,
-                )
-                canvas.restoreState()
-            except Exception:
-                pass
+        img = self._img_reader
+        if img is None:
+            return
+        canvas.saveState()
+        canvas.drawImage(
+            img,
+            0,
+            0,
+            width=self.pagesize[0],
+            height=self.pagesize[1],
+            preserveAspectRatio=False,
+            mask=None,
+        )
+        canvas.restoreState()
+
+
+@lru_cache(maxsize=8)
+def _get_table_style(header_align: str, data_align: str) -> TableStyle:
+    """Estilo padrão de tabela, construído uma vez por combinação de alinhamentos."""
+    return TableStyle(
+        [
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("LINEBELOW", (0, 0), (-1, 0), 2, colors.black),
+            ("ALIGN", (0, 0), (-1, 0), header_align),
+            ("VALIGN", (0, 0), (-1, 0), "MIDDLE"),
+            ("ALIGN", (0, 1), (-1, -1), data_align),
+            ("VALIGN", (0, 1), (-1, -1), "MIDDLE"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 0), (-1, -1), 10),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+            ("TOPPADDING", (0, 0), (-1, 0), 8),
+            ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
+            ("TOPPADDING", (0, 1), (-1, -1), 6),
+            ("LEFTPADDING", (0, 0), (-1, -1), 6),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ]
+    )
 
 
 def _make_table(data, col_widths=None, header_align="CENTER", data_align="CENTER"):
-    """Cria uma tabela formatada padrão."""
-    t = Table(data, colWidths=col_widths)
-    t.setStyle(
-        TableStyle(
-            [
-                ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ("LINEBELOW", (0, 0), (-1, 0), 2, colors.black),
-                ("ALIGN", (0, 0), (-1, 0), header_align),
-                ("VALIGN", (0, 0), (-1, 0), "MIDDLE"),
-                ("ALIGN", (0, 1), (-1, -1), data_align),
-                ("VALIGN", (0, 1), (-1, -1), "MIDDLE"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                ("TOPPADDING", (0, 0), (-1, 0), 8),
-                ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
-                ("TOPPADDING", (0, 1), (-1, -1), 6),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ]
-        )
-    )
+    """Cria uma tabela formatada padrão.
+
+    As células recebem strings prontas (nunca Paragraph), o que mantém o
+    dimensionamento de células barato. splitByRow evita a busca cara de
+    ponto de quebra em listas longas de pendências; repeatRows repete o
+    cabeçalho nas continuações.
+    """
+    t = Table(data, colWidths=col_widths, rowHeights=None, splitByRow=1, repeatRows=1)
+    t.setStyle(_get_table_style(header_align, data_align))
     return t
 
 
@@ -155,105 +221,101 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
     dados["sefaz_estadual"]["cabecalho_documento"]["situacao_geral"] = status_geral
     
     logger.debug("PDF: Iniciando geração com status_geral=%s", status_geral)
-    buffer = io.BytesIO()
-    
-    # Caminho para o template
-    base_dir = Path(__file__).resolve().parent.parent
-    template_path = base_dir / "assets" / "nota_explicativa_em_branco.png"
+
+    # Sub-estruturas acessadas várias vezes ao longo das seções: um lookup só
+    rf = dados.get("receita_federal") or {}
+    sefaz_est = dados.get("sefaz_estadual") or {}
+    fgts_data = dados.get("fgts") or {}
+    sefaz_man = dados.get("sefaz") or {}
+    mun = dados.get("debitos_municipais") or {}
+    parc_ativos = dados.get("parcelamentos_ativos") or {}
+
+    # Aliases locais dos callables quentes (LOAD_FAST em vez de LOAD_GLOBAL)
+    P = Paragraph
+    Sp = Spacer
+    MT = _make_table
+    fmt = _fmt_moeda
+
+    writer = _BAWriter()
 
     doc = PDFTemplate(
-        buffer,
+        writer,
         pagesize=A4,
         leftMargin=40,
         rightMargin=40,
         topMargin=60,
         bottomMargin=60,
-        template_path=str(template_path) if template_path.exists() else None,
+        template_path=_TEMPLATE_PATH_STR,
     )
 
-    styles = getSampleStyleSheet()
-    normal = styles["Normal"]
-    normal.spaceAfter = 4
-
-    heading = ParagraphStyle(
-        "Heading",
-        parent=styles["Heading2"],
-        fontName="Helvetica-Bold",
-        fontSize=12,
-        spaceBefore=10,
-        spaceAfter=4,
-    )
-    
-    heading3 = ParagraphStyle(
-        "Heading3",
-        parent=styles["Heading3"],
-        fontName="Helvetica-Bold",
-        fontSize=11,
-        spaceBefore=8,
-        spaceAfter=4,
-    )
+    normal = _NORMAL
+    heading = _HEADING
+    heading3 = _HEADING3
 
     story: list[Any] = []
 
     # ------------------------ CABEÇALHO ------------------------
-    story.append(Paragraph(f"Data do relatório: {dados['data_relatorio']}", normal))
-    story.append(Spacer(1, 4))
-    story.append(Paragraph(f"Requerente: {dados['requerente']}", normal))
-    story.append(Paragraph(f"CNPJ: {dados['cnpj']}", normal))
-    story.append(Paragraph(f"Tributação: {dados['tributacao']}", normal))
-    story.append(Paragraph(f"Certificado Digital: {dados['certificado_digital']}", normal))
-    story.append(Spacer(1, 8))
+    story.append(P(f"Data do relatório: {dados['data_relatorio']}", normal))
+    story.append(Sp(1, 4))
+    # Um único flowable para o bloco de identificação (menos passes de layout no build)
+    story.append(
+        P(
+            f"Requerente: {dados['requerente']}<br/>"
+            f"CNPJ: {dados['cnpj']}<br/>"
+            f"Tributação: {dados['tributacao']}<br/>"
+            f"Certificado Digital: {dados['certificado_digital']}",
+            normal,
+        )
+    )
+    story.append(Sp(1, 8))
 
     intro = (
         "Este relatório tem como objetivo acompanhar os débitos pendentes relacionados à entidade "
         "empresarial destacada acima, destacando os principais pontos sobre a situação fiscal, os "
         "valores devidos, datas de vencimento e providências necessárias para regularização."
     )
-    story.append(Paragraph(intro, normal))
-    story.append(Spacer(1, 8))
+    story.append(P(intro, normal))
+    story.append(Sp(1, 8))
 
-    story.append(Paragraph("DÉBITOS IDENTIFICADOS", heading))
-    story.append(Spacer(1, 8))
+    story.append(P("DÉBITOS IDENTIFICADOS", heading))
+    story.append(Sp(1, 8))
 
     # ========================= RECEITA FEDERAL =========================
-    story.append(Paragraph("RECEITA FEDERAL", heading))
+    story.append(P("RECEITA FEDERAL", heading))
     
     # Total de Previdência (OBJETIVO 3) - SOMENTE o total, sem tabela completa
     valor_exibido = formatar_total_previdencia(dados)
-    story.append(Paragraph(f"<b>Total de Previdência: {valor_exibido}</b>", normal))
-    story.append(Spacer(1, 8))
+    story.append(P(f"<b>Total de Previdência: {valor_exibido}</b>", normal))
+    story.append(Sp(1, 8))
     
     # PGFN Previdência (OBJETIVO 1)
-    if "receita_federal" in dados and dados["receita_federal"]:
-        receita = dados["receita_federal"]
-        pgfn_previdencia = receita.get("pgfn_previdencia", {})
+    if rf:
+        pgfn_previdencia = rf.get("pgfn_previdencia", {})
         if pgfn_previdencia.get("existe"):
             receitas_list = pgfn_previdencia.get("receitas", [])
             receitas_str = "; ".join(receitas_list) if receitas_list else "Não identificado"
             
-            story.append(Paragraph("<b>PGFN Previdência</b>", normal))
-            story.append(Paragraph(f"Receita: {receitas_str}", normal))
+            story.append(P("<b>PGFN Previdência</b>", normal))
+            story.append(P(f"Receita: {receitas_str}", normal))
             
             info_adicional = pgfn_previdencia.get("informacoes_adicionais_usuario", "")
             if info_adicional and info_adicional.strip():
                 # Quebra o texto em linhas se for muito longo
-                story.append(Paragraph("<b>Informações adicionais:</b>", normal))
+                story.append(P("<b>Informações adicionais:</b>", normal))
                 # Divide em parágrafos se houver quebras de linha
-                for linha in info_adicional.split('\n'):
-                    if linha.strip():
-                        story.append(Paragraph(linha.strip(), normal))
+                story.extend(P(s, normal) for s in (l.strip() for l in info_adicional.splitlines()) if s)
             else:
                 # Se não houver informações, mostra "(não informado)"
-                story.append(Paragraph("<b>Informações adicionais:</b> (não informado)", normal))
+                story.append(P("<b>Informações adicionais:</b> (não informado)", normal))
             
-            story.append(Spacer(1, 6))
+            story.append(Sp(1, 6))
     
-    story.append(Paragraph(dados["bloco_receita_federal"], normal))
-    story.append(Paragraph(f"Data da consulta: {dados['data_consulta_rf']}", normal))
-    story.append(Spacer(1, 10))
+    story.append(P(dados["bloco_receita_federal"], normal))
+    story.append(P(f"Data da consulta: {dados['data_consulta_rf']}", normal))
+    story.append(Sp(1, 10))
 
     # ========================= SEFAZ (ESTADUAL) =========================
-    story.append(Paragraph("SEFAZ (Estadual)", heading))
+    story.append(P("SEFAZ (Estadual)", heading))
 
     # 1. Consolida linhas manuais com linhas extraídas automaticamente
     tabela_sefaz_data = [["Descrição do Débito / Pendência", "Período / Placa", "Valor / Situação"]]
@@ -265,40 +327,40 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
         linhas_finais.extend(dados["sefaz_rows"])
 
     # B) Adiciona dados estruturados do Parser SEFAZ (Schema Novo)
-    if "sefaz_estadual" in dados and dados["sefaz_estadual"]:
-        sefaz = dados["sefaz_estadual"]
-        pendencias = sefaz.get("pendencias_identificadas", {})
-
-        # IPVA
-        for item in pendencias.get("ipva", []):
-            desc = f"IPVA {item.get('exercicio', '')}"
-            ref = item.get('placa', '')
-            val = _fmt_moeda(item.get('valor_total', 0))
-            linhas_finais.append([desc, ref, val])
-            
-        # Fronteira/Antecipado
-        for item in pendencias.get("icms_fronteira_antecipado", []):
-            desc = item.get('descricao', 'ICMS Antecipado')
-            ref = item.get('periodo_referencia', '')
-            val = _fmt_moeda(item.get('valor_total', 0))
-            linhas_finais.append([desc, ref, val])
-
-        # Competências em Aberto
-        for item in pendencias.get("icms_competencias_aberto", []):
-            desc = f"ICMS Omissão ({item.get('tipo_omissao', '')})"
-            ref = item.get('periodo', '')
-            val = _fmt_moeda(item.get('valor_estimado', 0))
-            linhas_finais.append([desc, ref, val])
-
-        # Autuações (estrutura antiga)
-        for item in pendencias.get("debitos_fiscais_autuacoes", []):
-            desc = f"Autuação {item.get('natureza_debito', '')} - Proc: {item.get('numero_processo','')}"
-            ref = "Exigível"
-            val = _fmt_moeda(item.get('valor_consolidado', 0))
-            linhas_finais.append([desc, ref, val])
+    if sefaz_est:
+        # Caso comum (relatório regular): todas as listas vazias — nada a iterar
+        pendencias = sefaz_est.get("pendencias_identificadas")
+        if pendencias:
+            # IPVA
+            if (ipva := pendencias.get("ipva")):
+                linhas_finais.extend(
+                    [f"IPVA {item.get('exercicio', '')}", item.get('placa', ''), fmt(item.get('valor_total', 0))]
+                    for item in ipva
+                )
+
+            # Fronteira/Antecipado
+            if (fronteira_ant := pendencias.get("icms_fronteira_antecipado")):
+                linhas_finais.extend(
+                    [item.get('descricao', 'ICMS Antecipado'), item.get('periodo_referencia', ''), fmt(item.get('valor_total', 0))]
+                    for item in fronteira_ant
+                )
+
+            # Competências em Aberto
+            if (competencias_aberto := pendencias.get("icms_competencias_aberto")):
+                linhas_finais.extend(
+                    [f"ICMS Omissão ({item.get('tipo_omissao', '')})", item.get('periodo', ''), fmt(item.get('valor_estimado', 0))]
+                    for item in competencias_aberto
+                )
+
+            # Autuações (estrutura antiga)
+            if (autuacoes := pendencias.get("debitos_fiscais_autuacoes")):
+                linhas_finais.extend(
+                    [f"Autuação {item.get('natureza_debito', '')} - Proc: {item.get('numero_processo','')}", "Exigível", fmt(item.get('valor_consolidado', 0))]
+                    for item in autuacoes
+                )
         
         # DÉBITOS FISCAIS (estrutura padronizada - quando IRREGULAR)
-        dados_processados = sefaz.get('dados_processados', {}) or {}
+        dados_processados = sefaz_est.get('dados_processados', {}) or {}
         detalhes = dados_processados.get('detalhes', {}) or {}
         debitos_fiscais = detalhes.get('debitos_fiscais', {}) or {}
         debitos_fiscais_list = debitos_fiscais.get('itens', []) or []
@@ -308,8 +370,8 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
         if debitos_fiscais_list:
             try:
                 # Adiciona tabela específica de Débitos Fiscais
-                story.append(Spacer(1, 6))
-                story.append(Paragraph("<b>Débitos Fiscais</b>", normal))
+                story.append(Sp(1, 6))
+                story.append(P("<b>Débitos Fiscais</b>", normal))
                 tabela_debitos = [["Processo", "Situação", "Saldo (R$)"]]
                 
                 for item in debitos_fiscais_list:
@@ -318,10 +380,10 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
                     processo = safe_str(item.get('processo'))
                     situacao = safe_str(item.get('situacao'))
                     saldo = to_float_ptbr(item.get('saldo'))
-                    tabela_debitos.append([processo, situacao, _fmt_moeda(saldo)])
+                    tabela_debitos.append([processo, situacao, fmt(saldo)])
                 
                 if len(tabela_debitos) > 1:  # Tem pelo menos cabeçalho + 1 linha
-                    story.append(_make_table(tabela_debitos, col_widths=[200, 100, 100], data_align="CENTER"))
+                    story.append(MT(tabela_debitos, col_widths=[200, 100, 100], data_align="CENTER"))
             except Exception as e:
                 logger.warning("Erro ao processar débitos fiscais no PDF: %s", str(e))
             
@@ -333,8 +395,8 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
             
             if fronteiras_list:
                 try:
-                    story.append(Spacer(1, 6))
-                    story.append(Paragraph("<b>Fronteiras</b>", normal))
+                    story.append(Sp(1, 6))
+                    story.append(P("<b>Fronteiras</b>", normal))
                     tabela_fronteiras = [["Num. DAE", "Dt. venc.", "Valor Original (R$)"]]
                     
                     for item in fronteiras_list:
@@ -343,10 +405,10 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
                         dae = safe_str(item.get('dae'))
                         vencimento = safe_str(item.get('vencimento'))
                         valor = to_float_ptbr(item.get('valor_original'))
-                        tabela_fronteiras.append([dae, vencimento, _fmt_moeda(valor)])
+                        tabela_fronteiras.append([dae, vencimento, fmt(valor)])
                     
                     if len(tabela_fronteiras) > 1:  # Tem pelo menos cabeçalho + 1 linha
-                        story.append(_make_table(tabela_fronteiras, col_widths=[120, 100, 120], data_align="CENTER"))
+                        story.append(MT(tabela_fronteiras, col_widths=[120, 100, 120], data_align="CENTER"))
                 except Exception as e:
                     logger.warning("Erro ao processar fronteiras no PDF: %s", str(e))
 
@@ -354,7 +416,7 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
     if linhas_finais:
         tabela_sefaz_data.extend(linhas_finais)
         story.append(
-            _make_table(
+            MT(
                 tabela_sefaz_data,
                 col_widths=[220, 100, 100],
                 data_align="CENTER",
@@ -362,71 +424,66 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
         )
     else:
         # Verifica se o parser identificou explicitamente como Regular (resiliente a None)
-        status_geral = dados.get("sefaz_estadual", {}).get("cabecalho_documento", {}).get("situacao_geral", "")
+        status_geral = sefaz_est.get("cabecalho_documento", {}).get("situacao_geral", "")
         status_geral = safe_str(status_geral).strip()
         status_upper = status_geral.upper() if status_geral else ""
         
         if status_upper == "REGULAR":
-            story.append(Paragraph("✅ Situação REGULAR (Certidão Negativa Emitida).", normal))
+            story.append(P("✅ Situação REGULAR (Certidão Negativa Emitida).", normal))
         elif status_upper == "IRREGULAR":
-            story.append(Paragraph("⚠️ Situação IRREGULAR - Há débitos pendentes.", normal))
+            story.append(P("⚠️ Situação IRREGULAR - Há débitos pendentes.", normal))
         elif status_upper == "INDETERMINADO":
-            story.append(Paragraph("ℹ️ Situação não pôde ser determinada automaticamente.", normal))
+            story.append(P("ℹ️ Situação não pôde ser determinada automaticamente.", normal))
         else:
-            story.append(Paragraph("Sem débitos informados ou identificados.", normal))
+            story.append(P("Sem débitos informados ou identificados.", normal))
     
     # Itens adicionais
-    manual_sefaz = dados.get("sefaz", {}).get("itens_adicionais_manuais", "").strip()
+    manual_sefaz = sefaz_man.get("itens_adicionais_manuais", "").strip()
     if manual_sefaz:
-        story.append(Paragraph(f"<b>Itens adicionais:</b>", normal))
-        for linha in manual_sefaz.split("\n"):
-            if linha.strip():
-                story.append(Paragraph(linha.strip(), normal))
+        story.append(P(f"<b>Itens adicionais:</b>", normal))
+        story.extend(P(s, normal) for s in (l.strip() for l in manual_sefaz.splitlines()) if s)
     else:
-        story.append(Paragraph("<b>Itens adicionais:</b> (não informado)", normal))
+        story.append(P("<b>Itens adicionais:</b> (não informado)", normal))
 
-    story.append(Paragraph(f"Data da consulta: {dados['data_consulta_sefaz']}", normal))
-    story.append(Spacer(1, 10))
+    story.append(P(f"Data da consulta: {dados['data_consulta_sefaz']}", normal))
+    story.append(Sp(1, 10))
 
     # ==================== DÉBITOS MUNICIPAIS =================
     # Força os Débitos Municipais a começar na página 2 (após cabeçalho EIKON 20 anos)
     story.append(PageBreak())
     # Espaçamento extra para evitar sobreposição com cabeçalho/logo do template
-    story.append(Spacer(1, 40))
-    story.append(Paragraph("DÉBITOS MUNICIPAIS", heading))
+    story.append(Sp(1, 40))
+    story.append(P("DÉBITOS MUNICIPAIS", heading))
     
     # Débitos municipais
-    manual_mun = dados.get("debitos_municipais", {}).get("texto_manual", "").strip()
+    manual_mun = mun.get("texto_manual", "").strip()
     if manual_mun:
-        story.append(Paragraph(f"<b>Débitos municipais:</b>", normal))
-        for linha in manual_mun.split("\n"):
-            if linha.strip():
-                story.append(Paragraph(linha.strip(), normal))
+        story.append(P(f"<b>Débitos municipais:</b>", normal))
+        story.extend(P(s, normal) for s in (l.strip() for l in manual_mun.splitlines()) if s)
     else:
-        story.append(Paragraph("<b>Débitos municipais:</b> (não informado)", normal))
-    story.append(Spacer(1, 6))
+        story.append(P("<b>Débitos municipais:</b> (não informado)", normal))
+    story.append(Sp(1, 6))
     if dados.get("municipais_rows") and len(dados["municipais_rows"]) > 0:
         tabela_mun = [["Descrição do Débito", "Período", "Valor", "Status"]] + dados["municipais_rows"]
         story.append(
-            _make_table(
+            MT(
                 tabela_mun,
                 col_widths=[180, 70, 90, 90],
                 data_align="CENTER",
             )
         )
     else:
-        story.append(Paragraph("Sem débitos informados.", normal))
-    story.append(Paragraph(f"Data da consulta: {dados['data_consulta_municipal']}", normal))
-    story.append(Spacer(1, 10))
+        story.append(P("Sem débitos informados.", normal))
+    story.append(P(f"Data da consulta: {dados['data_consulta_municipal']}", normal))
+    story.append(Sp(1, 10))
 
     # ============================ FGTS ================================
     # FGTS continua na mesma página após Débitos Municipais (ou próxima se necessário)
-    story.append(Paragraph("FGTS", heading))
+    story.append(P("FGTS", heading))
     
     # Lógica Híbrida: Usa dados estruturados se disponíveis, senão usa texto bloco
     usou_estrutura_fgts = False
-    if "fgts" in dados and dados["fgts"]:
-        fgts_data = dados["fgts"]
+    if fgts_data:
         crf = fgts_data.get("crf_detalhes", {})
         pendencias = fgts_data.get("pendencias_financeiras", {})
         
@@ -444,79 +501,78 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
                     crf.get("numero_certificacao", "-")
                 ]
             ]
-            story.append(_make_table(resumo_data, col_widths=[100, 160, 160]))
-            story.append(Spacer(1, 6))
+            story.append(MT(resumo_data, col_widths=[100, 160, 160]))
+            story.append(Sp(1, 6))
         
         # Tabela de Débitos do FGTS
         lista_debitos = pendencias.get("lista_debitos", [])
         if lista_debitos:
             tabela_fgts_data = [["Competência", "Valor", "Situação"]]
-            for debito in lista_debitos:
-                tabela_fgts_data.append([
-                    debito.get("competencia", "-"),
-                    _fmt_moeda(debito.get("valor_estimado", 0)),
-                    debito.get("situacao", "EM ABERTO")
-                ])
-            story.append(_make_table(tabela_fgts_data, col_widths=[120, 120, 100], data_align="CENTER"))
-            story.append(Spacer(1, 6))
+            tabela_fgts_data.extend(
+                [debito.get("competencia", "-"), fmt(debito.get("valor_estimado", 0)), debito.get("situacao", "EM ABERTO")]
+                for debito in lista_debitos
+            )
+            story.append(MT(tabela_fgts_data, col_widths=[120, 120, 100], data_align="CENTER"))
+            story.append(Sp(1, 6))
         elif crf.get("situacao_atual") == "REGULAR":
-            story.append(Paragraph("✅ Situação REGULAR - Não há débitos pendentes.", normal))
-            story.append(Spacer(1, 6))
+            story.append(P("✅ Situação REGULAR - Não há débitos pendentes.", normal))
+            story.append(Sp(1, 6))
 
     # Adiciona o bloco de texto (que serve como fallback ou complemento explicativo)
-    story.append(Paragraph(dados["bloco_fgts"], normal))
-    story.append(Paragraph(f"Data da consulta: {dados['data_consulta_fgts']}", normal))
-    story.append(Spacer(1, 12))
+    story.append(P(dados["bloco_fgts"], normal))
+    story.append(P(f"Data da consulta: {dados['data_consulta_fgts']}", normal))
+    story.append(Sp(1, 12))
 
     # ========================= PARCELAMENTOS =================
-    story.append(Paragraph("PARCELAMENTOS", heading))
+    story.append(P("PARCELAMENTOS", heading))
     
     # SISPAR - Nova estrutura com parcelamentos
-    if "receita_federal" in dados and dados["receita_federal"]:
-        receita = dados["receita_federal"]
-        sispar = receita.get("sispar", {})
+    if rf:
+        sispar = rf.get("sispar", {})
         
         if sispar.get("tem_sispar"):
             parcelamentos = sispar.get("parcelamentos", [])
             
             for idx, parc in enumerate(parcelamentos):
-                story.append(Paragraph(f"Parcelamento SISPAR {idx + 1 if len(parcelamentos) > 1 else ''}", heading3))
+                story.append(P(f"Parcelamento SISPAR {idx + 1 if len(parcelamentos) > 1 else ''}", heading3))
                 
-                # Informações básicas extraídas do PDF
+                # Informações básicas extraídas do PDF — um único flowable por
+                # parcelamento (linhas separadas por <br/>) em vez de um
+                # Paragraph por campo
                 linhas_info = []
-                
+
                 conta = parc.get("conta")
                 tipo = parc.get("tipo")
                 if conta:
                     if tipo:
-                        linhas_info.append(Paragraph(f"<b>Conta:</b> {conta} {tipo}", normal))
+                        linhas_info.append(f"<b>Conta:</b> {conta} {tipo}")
                     else:
-                        linhas_info.append(Paragraph(f"<b>Conta:</b> {conta}", normal))
-                
+                        linhas_info.append(f"<b>Conta:</b> {conta}")
+
                 modalidade = parc.get("modalidade")
                 if modalidade:
-                    linhas_info.append(Paragraph(f"<b>Modalidade:</b> {modalidade}", normal))
-                
+                    linhas_info.append(f"<b>Modalidade:</b> {modalidade}")
+
                 regime = parc.get("regime")
                 if regime:
-                    linhas_info.append(Paragraph(f"<b>Regime:</b> {regime}", normal))
-                
+                    linhas_info.append(f"<b>Regime:</b> {regime}")
+
                 limite = parc.get("limite_maximo_meses")
                 if limite:
-                    linhas_info.append(Paragraph(f"<b>Limite máximo:</b> ATÉ {limite} MESES", normal))
-                
+                    linhas_info.append(f"<b>Limite máximo:</b> ATÉ {limite} MESES")
+
                 negociado = parc.get("negociado_no_sispar")
                 if negociado is not None:
-                    linhas_info.append(Paragraph(f"<b>Negociado no SISPAR:</b> {'SIM' if negociado else 'NÃO'}", normal))
-                
+                    linhas_info.append(f"<b>Negociado no SISPAR:</b> {'SIM' if negociado else 'NÃO'}")
+
                 exigibilidade = parc.get("exigibilidade_suspensa")
                 if exigibilidade is not None:
-                    linhas_info.append(Paragraph(f"<b>Exigibilidade suspensa:</b> {'SIM' if exigibilidade else 'NÃO'}", normal))
-                
-                for linha in linhas_info:
-                    story.append(linha)
-                
-                story.append(Spacer(1, 6))
+                    linhas_info.append(f"<b>Exigibilidade suspensa:</b> {'SIM' if exigibilidade else 'NÃO'}")
+
+                if linhas_info:
+                    story.append(P("<br/>".join(linhas_info), normal))
+
+                story.append(Sp(1, 6))
                 
                 # Informações preenchidas manualmente (se houver)
                 qtd_parcelas = parc.get("quantidade_parcelas")
@@ -525,35 +581,33 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
                 competencias = parc.get("competencias", [])
                 
                 if qtd_parcelas or valor_total or valor_parcela or competencias:
-                    story.append(Paragraph("<b>Informações preenchidas manualmente:</b>", normal))
-                    linhas_manual = []
-                    
+                    linhas_manual = ["<b>Informações preenchidas manualmente:</b>"]
+
                     if qtd_parcelas:
-                        linhas_manual.append(Paragraph(f"<b>Quantidade de parcelas:</b> {qtd_parcelas}", normal))
+                        linhas_manual.append(f"<b>Quantidade de parcelas:</b> {qtd_parcelas}")
                     if valor_total:
-                        linhas_manual.append(Paragraph(f"<b>Valor total parcelado:</b> {valor_total}", normal))
+                        linhas_manual.append(f"<b>Valor total parcelado:</b> {valor_total}")
                     if valor_parcela:
-                        linhas_manual.append(Paragraph(f"<b>Valor da parcela:</b> {valor_parcela}", normal))
+                        linhas_manual.append(f"<b>Valor da parcela:</b> {valor_parcela}")
                     if competencias:
                         comps_str = ", ".join(competencias)
-                        linhas_manual.append(Paragraph(f"<b>Competências:</b> {comps_str}", normal))
-                    
-                    linhas_manual.append(Paragraph("<b>Status:</b> INFORMADO PELO USUÁRIO", normal))
-                    
-                    for linha in linhas_manual:
-                        story.append(linha)
+                        linhas_manual.append(f"<b>Competências:</b> {comps_str}")
+
+                    linhas_manual.append("<b>Status:</b> INFORMADO PELO USUÁRIO")
+
+                    story.append(P("<br/>".join(linhas_manual), normal))
                 else:
                     # Observação de necessidade de consulta manual
                     observacao = parc.get("observacao", "O relatório da Receita Federal não informa quantidade de parcelas, valores ou competências; é necessária consulta manual ao PGFN/SISPAR.")
-                    story.append(Paragraph(f"<b>Observação:</b> {observacao}", normal))
-                    story.append(Paragraph("<b>Status:</b> NECESSITA CONSULTA MANUAL", normal))
+                    story.append(P(f"<b>Observação:</b> {observacao}", normal))
+                    story.append(P("<b>Status:</b> NECESSITA CONSULTA MANUAL", normal))
                 
-                story.append(Spacer(1, 10))
+                story.append(Sp(1, 10))
     
     # Parcelamentos manuais
     parcelamentos_rows = dados.get("parcelamentos_rows") or []
     if parcelamentos_rows:
-        story.append(Paragraph("Outros Parcelamentos", heading3))
+        story.append(P("Outros Parcelamentos", heading3))
         tabela_parc = [
             [
                 "Parcelamento",
@@ -564,43 +618,38 @@ def gerar_pdf_bytes(dados: Dict[str, Any]) -> bytes:
             ]
         ] + parcelamentos_rows
         story.append(
-            _make_table(
+            MT(
                 tabela_parc,
                 col_widths=[110, 100, 90, 60, 60],
                 data_align="CENTER",
             )
         )
-    elif not ("receita_federal" in dados and dados["receita_federal"] and dados["receita_federal"].get("sispar", {}).get("tem_sispar")):
-        story.append(Paragraph("Não há parcelamentos informados.", normal))
+    elif not (rf and rf.get("sispar", {}).get("tem_sispar")):
+        story.append(P("Não há parcelamentos informados.", normal))
     
     # Parcelamentos ativos
-    manual_parc = dados.get("parcelamentos_ativos", {}).get("texto_manual", "").strip()
+    manual_parc = parc_ativos.get("texto_manual", "").strip()
     if manual_parc:
-        story.append(Paragraph(f"<b>Parcelamentos ativos:</b>", normal))
-        for linha in manual_parc.split("\n"):
-            if linha.strip():
-                story.append(Paragraph(linha.strip(), normal))
+        story.append(P(f"<b>Parcelamentos ativos:</b>", normal))
+        story.extend(P(s, normal) for s in (l.strip() for l in manual_parc.splitlines()) if s)
     else:
-        story.append(Paragraph("<b>Parcelamentos ativos:</b> (não informado)", normal))
+        story.append(P("<b>Parcelamentos ativos:</b> (não informado)", normal))
     
-    story.append(Spacer(1, 12))
+    story.append(Sp(1, 12))
     
     # ============================ CONCLUSÃO ===========================
-    story.append(Paragraph("CONCLUSÃO", heading))
-    for linha in dados["bloco_conclusao"].split("\n"):
-        if linha.strip():
-            story.append(Paragraph(linha.strip(), normal))
-    story.append(Spacer(1, 12))
+    story.append(P("CONCLUSÃO", heading))
+    story.extend(P(s, normal) for s in (l.strip() for l in dados["bloco_conclusao"].splitlines()) if s)
+    story.append(Sp(1, 12))
 
-    story.append(Paragraph("Eikon Soluções Ltda CNPJ: 09.502.539/0001-13", normal))
-    story.append(Spacer(1, 12))
+    story.append(P("Eikon Soluções Ltda CNPJ: 09.502.539/0001-13", normal))
+    story.append(Sp(1, 12))
 
-    story.append(Paragraph("Atenciosamente,", normal))
-    story.append(Spacer(1, 8))
-    story.append(Paragraph(dados["responsavel_nome"], normal))
-    story.append(Paragraph(dados["responsavel_cargo"], normal))
-    story.append(Paragraph(f"e-mail: {dados['responsavel_email']}", normal))
+    story.append(P("Atenciosamente,", normal))
+    story.append(Sp(1, 8))
+    story.append(P(dados["responsavel_nome"], normal))
+    story.append(P(dados["responsavel_cargo"], normal))
+    story.append(P(f"e-mail: {dados['responsavel_email']}", normal))
 
     doc.build(story)
-    buffer.seek(0)
-    return buffer.read()
\ No newline at end of file
+    return bytes(writer.ba)
\ No newline at end of file
@@ -5,10 +5,26 @@ Utilitários compartilhados para conversão de valores e formatação.
 
 import re
 import logging
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Padrões compilados uma vez no import (evita o lookup no cache do re a cada chamada)
+_RE_NON_NUMERIC = re.compile(r'[^\d.,]')
+_RE_SPACES = re.compile(r' +')
+
+# Fast path de parsing monetário: remove o "entulho" comum ("R$", espaços)
+# com str.translate (loop em C), deixando o regex só para entradas atípicas
+_TRANSLATE_CLUTTER = {ord(c): None for c in 'Rr$ \t\xa0\n'}
+_CHARS_NUMERICOS = frozenset('0123456789.,')
+
+# Valores que indicam ausência de débito (Regular); None é tratado antes via "is None"
+_VALORES_AUSENTES = frozenset({"", "-", "não identificado", "nao identificado", "não informado", "nao informado"})
+
+# Troca , <-> . em um único passe (formato en_US -> pt-BR), sem sentinela
+_BR_TRANS = str.maketrans({',': '.', '.': ','})
+
 
 def safe_str(x: any) -> str:
     """
@@ -29,54 +45,100 @@ def normalize_text(s: str) -> str:
     """
     if not s:
         return ""
-    # Remove quebras de linha excessivas
-    texto = re.sub(r'\n{3,}', '\n\n', str(s))
+    # Remove quebras de linha excessivas (replace em C converge em 1-2 passes,
+    # sem o motor de regex)
+    texto = str(s)
+    while '\n\n\n' in texto:
+        texto = texto.replace('\n\n\n', '\n\n')
     # Colapsa espaços múltiplos
-    texto = re.sub(r' +', ' ', texto)
+    texto = _RE_SPACES.sub(' ', texto)
     # Remove espaços no início/fim
     texto = texto.strip()
     return texto
 
 
+@lru_cache(maxsize=1024)
+def _converter_br_cached(valor_str: str) -> float:
+    """Parsing propriamente dito, memoizado sobre a string bruta."""
+    try:
+        # Remove tudo que não for dígito, ponto ou vírgula
+        limpo = valor_str.strip().translate(_TRANSLATE_CLUTTER)
+        if limpo and not _CHARS_NUMERICOS.issuperset(limpo):
+            limpo = _RE_NON_NUMERIC.sub('', limpo)
+
+        if not limpo:
+            return 0.0
+
+        # Se tem vírgula, assume formato BR (ponto = milhar, vírgula = decimal)
+        virgula = limpo.rfind(',')
+        if virgula != -1:
+            if limpo.find(',') == virgula:
+                # Vírgula única: parser manual em um passe, só aritmética
+                # inteira (sem replace intermediário nem strtod genérico)
+                inteiro = 0
+                frac = 0
+                frac_digitos = 0
+                apos_virgula = False
+                for ch in limpo:
+                    o = ord(ch)
+                    if 48 <= o <= 57:
+                        if apos_virgula:
+                            frac = frac * 10 + (o - 48)
+                            frac_digitos += 1
+                        else:
+                            inteiro = inteiro * 10 + (o - 48)
+                    elif ch == ',':
+                        apos_virgula = True
+                    # pontos de milhar são ignorados
+                escala = 10 ** frac_digitos
+                return (inteiro * escala + frac) / escala
+            # Vírgulas múltiplas: normalização antiga (float() rejeita e cai no except)
+            limpo = limpo.replace('.', '').replace(',', '.')
+        # Se só tem ponto, pode ser formato internacional ou BR sem decimais
+        else:
+            ultimo_ponto = limpo.rfind('.')
+            # find != rfind <=> mais de um ponto => milhares BR;
+            # ponto único mantém como está (pode ser decimal internacional)
+            if ultimo_ponto != -1 and limpo.find('.') != ultimo_ponto:
+                limpo = limpo.replace('.', '')
+
+        return float(limpo)
+    except (ValueError, AttributeError):
+        return 0.0
+
+
 def converter_valor_br_para_float(valor_str: str) -> float:
     """
     Converte string monetária brasileira (ex: '1.000,00' ou '99.249,14') para float.
-    
+
     Trata:
     - Pontos como separadores de milhar
     - Vírgula como separador decimal
     - Remove caracteres não numéricos (R$, espaços, etc.)
-    
+
     Exemplos:
         '1.000,00' -> 1000.0
         '99.249,14' -> 99249.14
         'R$ 1.000,00' -> 1000.0
-        '1.000' -> 1000.0
+
+    Os mesmos valores brutos se repetem ao longo de um relatório; o parsing
+    real fica em _converter_br_cached (entradas não-string viram str antes,
+    garantindo chave hasheável).
     """
     if not valor_str:
         return 0.0
-    
-    try:
-        # Remove tudo que não for dígito, ponto ou vírgula
-        limpo = re.sub(r'[^\d.,]', '', str(valor_str).strip())
-        
-        if not limpo:
-            return 0.0
-        
-        # Se tem vírgula, assume formato BR (ponto = milhar, vírgula = decimal)
-        if ',' in limpo:
-            # Remove pontos de milhar e troca vírgula por ponto
-            limpo = limpo.replace('.', '').replace(',', '.')
-        # Se só tem ponto, pode ser formato internacional ou BR sem decimais
-        elif '.' in limpo:
-            # Se tem mais de um ponto, assume que são milhares BR
-            if limpo.count('.') > 1:
-                limpo = limpo.replace('.', '')
-            # Caso contrário, mantém como está (pode ser decimal internacional)
-        
-        return float(limpo)
-    except (ValueError, AttributeError):
-        return 0.0
+    return _converter_br_cached(str(valor_str))
+
+
+def converter_valores_br(valores) -> list:
+    """
+    Converte uma sequência de valores monetários BR em lote.
+
+    Paga o lookup da função uma única vez e devolve a lista pronta;
+    útil ao converter colunas inteiras (sefaz_rows, municipais_rows etc.).
+    """
+    conv = converter_valor_br_para_float
+    return [conv(v) for v in valores]
 
 
 def to_float_ptbr(value: any) -> float:
@@ -89,17 +151,25 @@ def to_float_ptbr(value: any) -> float:
     Returns:
         float: Valor convertido ou 0.0 se inválido
     """
+    # Caso mais comum primeiro: número já parseado (checagem de tipo exato,
+    # mais barata que isinstance)
+    tipo = type(value)
+    if tipo is float:
+        return value
+    if tipo is int:
+        return float(value)
+
     if value is None:
         return 0.0
-    
-    # Se já é float ou int, retorna direto
-    if isinstance(value, (float, int)):
-        return float(value)
-    
+
     # Se é string, tenta converter usando converter_valor_br_para_float
-    if isinstance(value, str):
+    if tipo is str:
         return converter_valor_br_para_float(value)
-    
+
+    # Subclasses numéricas (bool, numpy etc.) continuam virando float direto
+    if isinstance(value, (float, int)):
+        return float(value)
+
     # Para outros tipos, tenta converter para string primeiro
     try:
         return converter_valor_br_para_float(str(value))
@@ -107,20 +177,19 @@ def to_float_ptbr(value: any) -> float:
         return 0.0
 
 
+@lru_cache(maxsize=512)
 def formatar_moeda_br(valor: float) -> str:
     """
     Formata float para string monetária brasileira (R$ X.XXX,XX).
+
+    Memoizada: os mesmos valores (parcelas recorrentes, totais repetidos)
+    aparecem várias vezes num mesmo relatório.
     """
-    if valor == 0.0:
-        return "R$ 0,00"
-    
-    try:
-        valor_str = f"{valor:,.2f}"
-        # Troca vírgula por X temporariamente, depois troca ponto por vírgula e X por ponto
-        valor_str = valor_str.replace(",", "X").replace(".", ",").replace("X", ".")
-        return f"R$ {valor_str}"
-    except (ValueError, TypeError):
+    # format() não levanta para int/float; o guard de tipo substitui o
+    # try/except (sem custo de frame de exceção por chamada)
+    if not isinstance(valor, (int, float)) or valor == 0.0:
         return "R$ 0,00"
+    return f"R$ {format(valor, ',.2f').translate(_BR_TRANS)}"
 
 
 def formatar_total_previdencia(dados: dict) -> str:
@@ -142,40 +211,35 @@ def formatar_total_previdencia(dados: dict) -> str:
     previdencia = receita_federal.get("previdencia", {})
     total_previdencia = previdencia.get("total_previdencia")
     
-    # Valores que indicam ausência de débito (Regular)
-    valores_ausentes = [None, "", "-", "não identificado", "nao identificado", "não informado", "nao informado"]
-    
     # Verifica se o valor está ausente
     if total_previdencia is None:
         return "Regular"
-    
+
     # Se for string, verifica se está vazia ou é um valor ausente
     if isinstance(total_previdencia, str):
-        valor_limpo = total_previdencia.strip().lower()
-        if not valor_limpo or valor_limpo in valores_ausentes:
+        valor_limpo = total_previdencia.strip()
+        if not valor_limpo:
             return "Regular"
-        
+
         # Se já está formatado como "R$ X.XXX,XX", retorna apenas o valor (sem "Total de Previdência:")
-        if valor_limpo.startswith("r$"):
-            return total_previdencia.strip()
-        # Se não começa com R$, tenta formatar como moeda
-        try:
-            # Tenta converter string BR para float
-            valor_float = converter_valor_br_para_float(total_previdencia)
-            if valor_float > 0:
-                return formatar_moeda_br(valor_float)
-            else:
-                return "Regular"
-        except (ValueError, TypeError):
+        # (compara só os 2 primeiros chars, sem lower() da string inteira)
+        if valor_limpo[:2].lower() == "r$":
+            return valor_limpo
+
+        # Marcadores de ausência são curtos; strings longas nem precisam do lower()
+        if len(valor_limpo) <= 16 and valor_limpo.lower() in _VALORES_AUSENTES:
             return "Regular"
-    
-    # Se for número, formata
-    try:
-        valor_float = float(total_previdencia)
+        # Se não começa com R$, tenta converter string BR para float
+        # (converter_valor_br_para_float nunca levanta: retorna 0.0 no erro)
+        valor_float = converter_valor_br_para_float(total_previdencia)
         if valor_float > 0:
             return formatar_moeda_br(valor_float)
-        else:
-            return "Regular"
-    except (ValueError, TypeError):
         return "Regular"
 
+    # Se for número, formata; qualquer outro tipo é tratado como ausente
+    if isinstance(total_previdencia, (int, float)):
+        valor_float = float(total_previdencia)
+        if valor_float > 0:
+            return formatar_moeda_br(valor_float)
+    return "Regular"
+
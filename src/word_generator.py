@@ -7,25 +7,89 @@ Objetivo:
 - Replicar o conteúdo do PDF (seções, textos e tabelas);
 - Gerar um arquivo de 1–2 páginas, sem exagero de quebras;
 - Incluir o papel timbrado como imagem no topo do documento.
+
+Nota de performance: o caminho quente deste módulo é a mutação de XML do
+python-docx/lxml (estrutura do documento), não laços numéricos. Ganhos vêm
+de reduzir o número de chamadas add_paragraph/add_row e de montar o XML em
+lote (ver _add_paragrafos_bulk/_add_table), não de JIT/Cython — Numba nem
+compila formatação de strings, então não decore helpers como _fmt_moeda_word
+com @njit.
+
+O degrau seguinte seria renderizar o document.xml inteiro por template
+(estilo docxtpl/Jinja2). Foi avaliado e descartado: o corpo tem muitas
+seções condicionais e tabelas de forma variável, o que transformaria o
+template numa segunda implementação da lógica deste módulo, e traria uma
+dependência nova por um ganho residual — depois do batching acima restam
+poucas chamadas à API do python-docx por documento.
 """
 
 from __future__ import annotations
 
 import io
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List
+
+from xml.sax.saxutils import escape
 
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 from docx.shared import Pt
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from src.utils import formatar_total_previdencia
+from src.utils import formatar_moeda_br, formatar_total_previdencia
+
+# Caminho e bytes do papel timbrado resolvidos uma única vez no import:
+# nenhum stat()/open() por documento gerado
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_TEMPLATE_PATH = _BASE_DIR / "assets" / "nota_explicativa_em_branco.png"
+try:
+    _TIMBRADO_BYTES = _TEMPLATE_PATH.read_bytes()
+except (FileNotFoundError, OSError):
+    _TIMBRADO_BYTES = None
+
+# Tamanhos de fonte usados no documento inteiro: Pt() cria um objeto Length
+# novo a cada chamada, então constrói uma vez só
+_PT10 = Pt(10)
+_PT11 = Pt(11)
+_PT12 = Pt(12)
+
+# Checagem case-insensitive de situação sem alocar um .upper() por documento;
+# \b garante que "IRREGULAR" não conte como regular
+_REGULAR_RE = re.compile(r"\bREGULAR\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _largura_util() -> int:
+    """Largura útil (página menos margens, em EMU) do documento padrão.
+
+    As dimensões da seção default do python-docx são estáveis por processo;
+    o cálculo roda uma vez, no primeiro uso — e não no import, para não
+    pagar o parse do default.docx só por carregar este módulo.
+    """
+    section = Document().sections[0]
+    return section.page_width - section.left_margin - section.right_margin
 
 
 def _configurar_estilo_normal(doc: Document) -> None:
-    """Configura o estilo padrão do documento."""
+    """Configura o estilo padrão do documento e os estilos de célula de tabela."""
     style = doc.styles["Normal"]
     style.font.name = "Calibri"
-    style.font.size = Pt(11)
+    style.font.size = _PT11
+
+    # Estilos nomeados para células: aplicar p.style uma vez substitui o
+    # loop de mutação run-a-run (menos escritas de XML por tabela)
+    body10 = doc.styles.add_style("Body10", WD_STYLE_TYPE.PARAGRAPH)
+    body10.font.name = "Calibri"
+    body10.font.size = _PT10
+
+    body10_bold = doc.styles.add_style("Body10Bold", WD_STYLE_TYPE.PARAGRAPH)
+    body10_bold.font.name = "Calibri"
+    body10_bold.font.size = _PT10
+    body10_bold.font.bold = True
 
 
 def _add_heading(doc: Document, text: str) -> None:
@@ -33,7 +97,7 @@ def _add_heading(doc: Document, text: str) -> None:
     p = doc.add_paragraph()
     run = p.add_run(text)
     run.bold = True
-    run.font.size = Pt(12)
+    run.font.size = _PT12
     p.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
 
@@ -41,52 +105,128 @@ def _add_paragrafo(doc: Document, text: str) -> None:
     """Parágrafo padrão."""
     if not text:
         return
+    # O estilo Normal já define 11pt: reescrever o tamanho run a run só
+    # gerava um w:rPr/w:sz redundante por parágrafo
     p = doc.add_paragraph(text)
-    for run in p.runs:
-        run.font.size = Pt(11)
     p.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
 
-def _add_table(doc: Document, headers, rows):
-    """Tabela simples com cabeçalho em negrito."""
+# Parágrafo Normal pronto (herda 11pt do estilo), para emissão em lote
+_P_TEMPLATE = '<w:p %s><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>' % nsdecls('w')
+
+
+def _add_paragrafos_bulk(doc: Document, texts) -> None:
+    """Acrescenta vários parágrafos Normal de uma vez via XML direto.
+
+    Evita o ciclo add_paragraph + varredura de runs por linha; o sectPr
+    final do corpo é respeitado (parágrafos entram antes dele).
+    """
+    body = doc.element.body
+    sect_pr = body.find(qn('w:sectPr'))
+    for t in texts:
+        if not t:
+            continue
+        p = parse_xml(_P_TEMPLATE.format(text=escape(t)))
+        if sect_pr is not None:
+            sect_pr.addprevious(p)
+        else:
+            body.append(p)
+
+
+# Células prontas (estilos Body10/Body10Bold): injetadas como XML, sem passar
+# pelo setter .text do python-docx, que reconstrói parágrafos célula a célula
+_TC_TEMPLATE = (
+    '<w:tc><w:tcPr><w:tcW w:w="0" w:type="auto"/></w:tcPr>'
+    '<w:p><w:pPr><w:pStyle w:val="Body10"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p></w:tc>'
+)
+_TC_HDR_TEMPLATE = _TC_TEMPLATE.replace('"Body10"', '"Body10Bold"')
+# Todas as linhas de dados são montadas numa string só e parseadas de uma vez
+# dentro de um <w:tbl> descartável (o lxml exige raiz única)
+_ROWS_WRAPPER = '<w:tbl %s>{rows}</w:tbl>' % nsdecls('w')
+
+
+def _add_table(doc: Document, headers, rows) -> bool:
+    """Tabela simples com cabeçalho em negrito.
+
+    Retorna False quando não há linhas (nada é inserido no documento),
+    permitindo ao chamador pular espaçadores que ficariam órfãos.
+    """
     if not rows:
-        return
+        return False
 
-    table = doc.add_table(rows=1, cols=len(headers))
+    table = doc.add_table(rows=0, cols=len(headers))
     table.style = "Table Grid"
 
-    # Cabeçalho
-    hdr_cells = table.rows[0].cells
-    for i, h in enumerate(headers):
-        hdr_cells[i].text = h
-
-    for cell in hdr_cells:
-        for p in cell.paragraphs:
-            for run in p.runs:
-                run.bold = True
-                run.font.size = Pt(10)
-
-    # Linhas de dados
-    for row in rows:
-        row_cells = table.add_row().cells
-        for i, value in enumerate(row):
-            row_cells[i].text = str(value)
-        for cell in row_cells:
-            for p in cell.paragraphs:
-                for run in p.runs:
-                    run.font.size = Pt(10)
+    # Cabeçalho + linhas de dados em lote: uma única passada de parse para a
+    # tabela toda (o negrito do cabeçalho vem do pStyle Body10Bold, sem
+    # mutação run-a-run depois da criação)
+    xml_linhas = '<w:tr>%s</w:tr>' % "".join(
+        _TC_HDR_TEMPLATE.format(text=escape(str(h))) for h in headers
+    )
+    xml_linhas += "".join(
+        '<w:tr>%s</w:tr>' % "".join(_TC_TEMPLATE.format(text=escape(str(value))) for value in row)
+        for row in rows
+    )
+    tbl = table._tbl
+    for tr in parse_xml(_ROWS_WRAPPER.format(rows=xml_linhas)):
+        tbl.append(tr)
 
     # Espaço após a tabela
     doc.add_paragraph("")
+    return True
+
+
+@lru_cache(maxsize=2048)
+def _fmt_moeda_word_cached(valor):
+    """Conversão+formatação memoizada sobre o valor bruto (str/int/float)."""
+    try:
+        return formatar_moeda_br(float(valor))
+    except (ValueError, TypeError):
+        return str(valor)
+
+
+# Zeros vindos como string das planilhas/parsers; "not valor" já cobre
+# None, 0, 0.0 e "" sem precisar de hash
+_ZERO_LIKE = frozenset(("0", "0.0", "0,00"))
+
+
+def _sim_nao(v) -> str:
+    return "SIM" if v else "NÃO"
+
+
+# Campos simples do parcelamento SISPAR: (chave, rótulo, formatador opcional,
+# emite_falso). Booleanos são emitidos mesmo quando False (teste "is not
+# None"); os demais só quando truthy, como nos ifs originais.
+_SISPAR_FIELDS = (
+    ("modalidade", "Modalidade", None, False),
+    ("regime", "Regime", None, False),
+    ("limite_maximo_meses", "Limite máximo", "ATÉ {} MESES".format, False),
+    ("negociado_no_sispar", "Negociado no SISPAR", _sim_nao, True),
+    ("exigibilidade_suspensa", "Exigibilidade suspensa", _sim_nao, True),
+)
 
 
 def _fmt_moeda_word(valor):
-    """Formata float para R$ X.XXX,XX"""
+    """Formata float para R$ X.XXX,XX (delega em formatar_moeda_br).
+
+    Valores repetidos (zeros, totais recorrentes) são comuns nas linhas de
+    SEFAZ/FGTS; entradas hasheáveis passam pelo cache LRU.
+    """
     if not valor:
         return "-"
+    tipo = type(valor)
+    if tipo is int or tipo is float:
+        # Número já parseado: formata direto, sem float() nem try/except
+        return formatar_moeda_br(valor)
+    if tipo is str:
+        if valor in _ZERO_LIKE:
+            return "-"
+        return _fmt_moeda_word_cached(valor)
+    if isinstance(valor, (str, int, float)):
+        return _fmt_moeda_word_cached(valor)
     try:
-        val_float = float(valor)
-        return f"R$ {val_float:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        return formatar_moeda_br(float(valor))
     except (ValueError, TypeError):
         return str(valor)
 
@@ -96,57 +236,81 @@ def _add_papel_timbrado_topo(doc: Document) -> None:
     Adiciona o papel timbrado como imagem no topo do documento (antes do texto).
     Usa o mesmo arquivo do PDF: assets/nota_explicativa_em_branco.png
     """
-    base_dir = Path(__file__).resolve().parent.parent
-    template_path = base_dir / "assets" / "nota_explicativa_em_branco.png"
-
-    if not template_path.exists():
+    if _TIMBRADO_BYTES is None:
         return
 
-    # Usa a largura útil da página (largura menos margens) para a imagem
-    section = doc.sections[0]
-    largura_util = section.page_width - section.left_margin - section.right_margin
-
-    # add_picture aceita o valor em EMU (page_width já está em EMU)
-    doc.add_picture(str(template_path), width=largura_util)
+    # add_picture aceita o valor em EMU (_LARGURA_UTIL já está em EMU)
+    doc.add_picture(io.BytesIO(_TIMBRADO_BYTES), width=_largura_util())
     # Pequeno espaço depois da imagem
     doc.add_paragraph("")
 
 
-def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
-    """
-    Gera o arquivo .docx em memória a partir do dicionário 'dados'.
-    Retorna os bytes do arquivo para uso no st.download_button.
-    """
-    doc = Document()
-    _configurar_estilo_normal(doc)
+@lru_cache(maxsize=1)
+def _template_docx_bytes() -> bytes:
+    """Serializa uma vez o documento base (estilos + papel timbrado).
 
-    # Papel timbrado no topo
-    _add_papel_timbrado_topo(doc)
+    Abrir um Document() em branco re-parseia o default.docx do python-docx;
+    partir de um template pronto amortiza esse custo e o da configuração de
+    estilos/imagem por todos os relatórios do processo. A serialização fica
+    para o primeiro relatório (e não para o import), encurtando o cold start
+    de reruns do Streamlit que nem chegam a gerar docx.
+    """
+    tpl = Document()
+    _configurar_estilo_normal(tpl)
+    _add_papel_timbrado_topo(tpl)
+    buf = io.BytesIO()
+    tpl.save(buf)
+    return buf.getvalue()
+
+
+# Textos fixos do relatório: construídos (e internados) uma única vez no
+# import, em vez de realocados como literais locais a cada documento
+_INTRO = (
+    "Este relatório tem como objetivo acompanhar os débitos pendentes relacionados à entidade "
+    "empresarial destacada acima, destacando os principais pontos sobre a situação fiscal, os "
+    "valores devidos, datas de vencimento e providências necessárias para regularização. Nos "
+    "casos em que haja desacordo com os débitos e irregularidades apresentadas ou já tenha sido "
+    "efetuado o pagamento, favor entrar em contato conosco para a resolução da pendência."
+)
+_DEBITOS_LEAD = "Abaixo, estão listados os débitos pendentes e a situação atual da empresa:"
+_EIKON_FOOTER = "Eikon Soluções Ltda CNPJ: 09.502.539/0001-13"
+_ATENCIOSAMENTE = "Atenciosamente,"
+
+
+def _montar_documento(dados: Dict[str, Any]) -> Document:
+    """Monta o Document completo do relatório (conteúdo compartilhado entre
+    a saída em bytes e a saída em stream)."""
+    # Template já traz estilo Normal/Body10 configurado e papel timbrado no topo
+    doc = Document(io.BytesIO(_template_docx_bytes()))
+
+    # Aliases locais: um lookup de dados.get e o doc já ligado ao escritor
+    # de parágrafos (menos rebinding por chamada nas ~60 emissões abaixo)
+    get = dados.get
+    add_p = partial(_add_paragrafo, doc)
+
+    # Sub-dicionários lidos várias vezes ao longo do documento: resolve o
+    # encadeamento dados.get(...).get(...) uma única vez aqui
+    receita = get("receita_federal") or {}
+    sispar = receita.get("sispar") or {}
+    sefaz_est = get("sefaz_estadual") or {}
+    fgts_data = get("fgts") or {}
 
     # ======================= CABEÇALHO / DADOS BÁSICOS =======================
 
-    _add_paragrafo(doc, f"Data do relatório: {dados['data_relatorio']}")
-    _add_paragrafo(doc, f"Requerente: {dados['requerente']}")
-    _add_paragrafo(doc, f"CNPJ: {dados['cnpj']}")
-    _add_paragrafo(doc, f"Tributação: {dados['tributacao']}")
-    _add_paragrafo(doc, f"Certificado Digital: {dados['certificado_digital']}")
+    _add_paragrafos_bulk(doc, (
+        f"Data do relatório: {dados['data_relatorio']}",
+        f"Requerente: {dados['requerente']}",
+        f"CNPJ: {dados['cnpj']}",
+        f"Tributação: {dados['tributacao']}",
+        f"Certificado Digital: {dados['certificado_digital']}",
+    ))
     doc.add_paragraph("")
 
-    intro = (
-        "Este relatório tem como objetivo acompanhar os débitos pendentes relacionados à entidade "
-        "empresarial destacada acima, destacando os principais pontos sobre a situação fiscal, os "
-        "valores devidos, datas de vencimento e providências necessárias para regularização. Nos "
-        "casos em que haja desacordo com os débitos e irregularidades apresentadas ou já tenha sido "
-        "efetuado o pagamento, favor entrar em contato conosco para a resolução da pendência."
-    )
-    _add_paragrafo(doc, intro)
+    add_p(_INTRO)
     doc.add_paragraph("")
 
     _add_heading(doc, "DÉBITOS IDENTIFICADOS")
-    _add_paragrafo(
-        doc,
-        "Abaixo, estão listados os débitos pendentes e a situação atual da empresa:",
-    )
+    add_p(_DEBITOS_LEAD)
     doc.add_paragraph("")
 
     # ========================= RECEITA FEDERAL =========================
@@ -155,35 +319,33 @@ def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
     
     # Total de Previdência (OBJETIVO 3) - SOMENTE o total, sem tabela completa
     valor_exibido = formatar_total_previdencia(dados)
-    _add_paragrafo(doc, f"Total de Previdência: {valor_exibido}")
+    add_p(f"Total de Previdência: {valor_exibido}")
     doc.add_paragraph("")
     
     # PGFN Previdência (OBJETIVO 1)
-    if "receita_federal" in dados and dados["receita_federal"]:
-        receita = dados["receita_federal"]
+    if receita:
         pgfn_previdencia = receita.get("pgfn_previdencia", {})
         if pgfn_previdencia.get("existe"):
             receitas_list = pgfn_previdencia.get("receitas", [])
             receitas_str = "; ".join(receitas_list) if receitas_list else "Não identificado"
             
-            _add_paragrafo(doc, "PGFN Previdência")
-            _add_paragrafo(doc, f"Receita: {receitas_str}")
+            add_p("PGFN Previdência")
+            add_p(f"Receita: {receitas_str}")
             
             info_adicional = pgfn_previdencia.get("informacoes_adicionais_usuario", "")
             if info_adicional and info_adicional.strip():
-                _add_paragrafo(doc, "Informações adicionais:")
-                # Divide em parágrafos se houver quebras de linha
-                for linha in info_adicional.split('\n'):
-                    if linha.strip():
-                        _add_paragrafo(doc, linha.strip())
+                add_p("Informações adicionais:")
+                # Divide em parágrafos se houver quebras de linha (emissão em
+                # lote; linhas vazias são descartadas pelo próprio helper)
+                _add_paragrafos_bulk(doc, map(str.strip, info_adicional.splitlines()))
             else:
                 # Se não houver informações, mostra "(não informado)"
-                _add_paragrafo(doc, "Informações adicionais: (não informado)")
+                add_p("Informações adicionais: (não informado)")
             
             doc.add_paragraph("")
     
-    _add_paragrafo(doc, dados.get("bloco_receita_federal", ""))
-    _add_paragrafo(doc, f"Data da consulta: {dados['data_consulta_rf']}")
+    add_p(get("bloco_receita_federal", ""))
+    add_p(f"Data da consulta: {dados['data_consulta_rf']}")
     doc.add_paragraph("")
 
     # ============================= SEFAZ ==============================
@@ -191,42 +353,41 @@ def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
     _add_heading(doc, "SEFAZ")
     
     # Consolida linhas manuais com linhas extraídas automaticamente
-    linhas_finais_sefaz = []
-    
-    # A) Adiciona linhas manuais (se houver)
-    sefaz_rows = dados.get("sefaz_rows") or []
-    if sefaz_rows:
-        linhas_finais_sefaz.extend(sefaz_rows)
-    
-    # B) Adiciona dados estruturados do Parser SEFAZ
-    if "sefaz_estadual" in dados and dados["sefaz_estadual"]:
-        sefaz = dados["sefaz_estadual"]
-        pendencias = sefaz.get("pendencias_identificadas", {})
-        
+    # A) Linhas manuais (se houver) já servem de base da lista
+    linhas_finais_sefaz = list(get("sefaz_rows") or ())
+
+    # B) Adiciona dados estruturados do Parser SEFAZ (comprehensions mantêm
+    # a iteração em C; default () evita alocar lista vazia por chave ausente)
+    if sefaz_est:
+        pendencias = sefaz_est.get("pendencias_identificadas", {})
+
         # IPVA
-        for item in pendencias.get("ipva", []):
-            desc = f"IPVA {item.get('exercicio', '')}"
-            ref = item.get('placa', '')
-            val = _fmt_moeda_word(item.get('valor_total', 0))
-            linhas_finais_sefaz.append([desc, ref, val])
-        
+        linhas_finais_sefaz += [
+            [f"IPVA {item.get('exercicio', '')}",
+             item.get('placa', ''),
+             _fmt_moeda_word(item.get('valor_total', 0))]
+            for item in pendencias.get("ipva", ())
+        ]
+
         # Fronteira/Antecipado
-        for item in pendencias.get("icms_fronteira_antecipado", []):
-            desc = item.get('descricao', 'ICMS Antecipado')
-            ref = item.get('periodo_referencia', '')
-            val = _fmt_moeda_word(item.get('valor_total', 0))
-            linhas_finais_sefaz.append([desc, ref, val])
-        
+        linhas_finais_sefaz += [
+            [item.get('descricao', 'ICMS Antecipado'),
+             item.get('periodo_referencia', ''),
+             _fmt_moeda_word(item.get('valor_total', 0))]
+            for item in pendencias.get("icms_fronteira_antecipado", ())
+        ]
+
         # Débitos Fiscais (estrutura antiga)
-        for item in pendencias.get("debitos_fiscais_autuacoes", []):
-            desc = f"Autuação {item.get('natureza_debito', '')}"
-            ref = item.get('periodo', '')
-            val = _fmt_moeda_word(item.get('valor_consolidado', 0))
-            linhas_finais_sefaz.append([desc, ref, val])
+        linhas_finais_sefaz += [
+            [f"Autuação {item.get('natureza_debito', '')}",
+             item.get('periodo', ''),
+             _fmt_moeda_word(item.get('valor_consolidado', 0))]
+            for item in pendencias.get("debitos_fiscais_autuacoes", ())
+        ]
         
         # DÉBITOS FISCAIS (estrutura padronizada - quando IRREGULAR)
         from src.utils import safe_str
-        dados_processados = sefaz.get('dados_processados', {})
+        dados_processados = sefaz_est.get('dados_processados', {})
         if dados_processados:
             detalhes = dados_processados.get('detalhes', {})
             debitos_fiscais = detalhes.get('debitos_fiscais', {}).get('itens', [])
@@ -266,29 +427,27 @@ def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
         )
     else:
         # Verifica se o parser identificou explicitamente como Regular
-        status_geral = dados.get("sefaz_estadual", {}).get("cabecalho_documento", {}).get("situacao_geral", "")
-        if "REGULAR" in status_geral.upper():
-            _add_paragrafo(doc, "✅ Situação REGULAR (Certidão Negativa Emitida).")
+        status_geral = sefaz_est.get("cabecalho_documento", {}).get("situacao_geral", "")
+        if _REGULAR_RE.search(status_geral):
+            add_p("✅ Situação REGULAR (Certidão Negativa Emitida).")
         else:
-            _add_paragrafo(doc, "Sem débitos informados ou identificados.")
+            add_p("Sem débitos informados ou identificados.")
     
     # Itens adicionais
-    manual_sefaz = dados.get("sefaz", {}).get("itens_adicionais_manuais", "").strip()
+    manual_sefaz = get("sefaz", {}).get("itens_adicionais_manuais", "").strip()
     if manual_sefaz:
-        _add_paragrafo(doc, "Itens adicionais:")
-        for linha in manual_sefaz.split("\n"):
-            if linha.strip():
-                _add_paragrafo(doc, linha.strip())
+        add_p("Itens adicionais:")
+        _add_paragrafos_bulk(doc, map(str.strip, manual_sefaz.splitlines()))
     else:
-        _add_paragrafo(doc, "Itens adicionais: (não informado)")
+        add_p("Itens adicionais: (não informado)")
     
-    _add_paragrafo(doc, f"Data da consulta: {dados['data_consulta_sefaz']}")
+    add_p(f"Data da consulta: {dados['data_consulta_sefaz']}")
     doc.add_paragraph("")
 
     # ======================= DÉBITOS MUNICIPAIS =======================
 
     _add_heading(doc, "DÉBITOS MUNICIPAIS")
-    municipais_rows = dados.get("municipais_rows") or []
+    municipais_rows = get("municipais_rows") or []
     if municipais_rows:
         _add_table(
             doc,
@@ -296,19 +455,17 @@ def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
             municipais_rows,
         )
     else:
-        _add_paragrafo(doc, "Sem débitos informados.")
+        add_p("Sem débitos informados.")
     
     # Débitos municipais
-    manual_mun = dados.get("debitos_municipais", {}).get("texto_manual", "").strip()
+    manual_mun = get("debitos_municipais", {}).get("texto_manual", "").strip()
     if manual_mun:
-        _add_paragrafo(doc, "Débitos municipais:")
-        for linha in manual_mun.split("\n"):
-            if linha.strip():
-                _add_paragrafo(doc, linha.strip())
+        add_p("Débitos municipais:")
+        _add_paragrafos_bulk(doc, map(str.strip, manual_mun.splitlines()))
     else:
-        _add_paragrafo(doc, "Débitos municipais: (não informado)")
+        add_p("Débitos municipais: (não informado)")
     
-    _add_paragrafo(doc, f"Data da consulta: {dados['data_consulta_municipal']}")
+    add_p(f"Data da consulta: {dados['data_consulta_municipal']}")
     doc.add_paragraph("")
 
     # =============================== FGTS =============================
@@ -316,8 +473,7 @@ def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
     _add_heading(doc, "FGTS")
     
     # Dados estruturados do FGTS
-    if "fgts" in dados and dados["fgts"]:
-        fgts_data = dados["fgts"]
+    if fgts_data:
         crf = fgts_data.get("crf_detalhes", {})
         pendencias = fgts_data.get("pendencias_financeiras", {})
         
@@ -328,8 +484,8 @@ def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
                 f"{crf.get('validade_inicio','')} a {crf.get('validade_fim','')}",
                 crf.get("numero_certificacao", "-")
             ]]
-            _add_table(doc, ["Situação", "Validade", "Certificação"], resumo_fgts_rows)
-            doc.add_paragraph("")
+            if _add_table(doc, ["Situação", "Validade", "Certificação"], resumo_fgts_rows):
+                doc.add_paragraph("")
         
         # Tabela de Débitos do FGTS
         lista_debitos = pendencias.get("lista_debitos", [])
@@ -341,14 +497,14 @@ def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
                     _fmt_moeda_word(debito.get("valor_estimado", 0)),
                     debito.get("situacao", "EM ABERTO")
                 ])
-            _add_table(doc, ["Competência", "Valor", "Situação"], tabela_fgts_rows)
-            doc.add_paragraph("")
+            if _add_table(doc, ["Competência", "Valor", "Situação"], tabela_fgts_rows):
+                doc.add_paragraph("")
         elif crf.get("situacao_atual") == "REGULAR":
-            _add_paragrafo(doc, "✅ Situação REGULAR - Não há débitos pendentes.")
+            add_p("✅ Situação REGULAR - Não há débitos pendentes.")
             doc.add_paragraph("")
     
-    _add_paragrafo(doc, dados.get("bloco_fgts", ""))
-    _add_paragrafo(doc, f"Data da consulta: {dados['data_consulta_fgts']}")
+    add_p(get("bloco_fgts", ""))
+    add_p(f"Data da consulta: {dados['data_consulta_fgts']}")
     doc.add_paragraph("")
 
     # =========================== PARCELAMENTOS ========================
@@ -356,78 +512,59 @@ def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
     _add_heading(doc, "PARCELAMENTOS")
     
     # SISPAR - Nova estrutura com parcelamentos
-    if "receita_federal" in dados and dados["receita_federal"]:
-        receita = dados["receita_federal"]
-        sispar = receita.get("sispar", {})
-        
-        if sispar.get("tem_sispar"):
-            parcelamentos = sispar.get("parcelamentos", [])
+    if sispar.get("tem_sispar"):
+        parcelamentos = sispar.get("parcelamentos", [])
             
-            for idx, parc in enumerate(parcelamentos):
-                titulo = f"Parcelamento SISPAR {idx + 1 if len(parcelamentos) > 1 else ''}"
-                _add_heading(doc, titulo)
-                
-                # Informações básicas extraídas do PDF
-                conta = parc.get("conta")
+        for idx, parc in enumerate(parcelamentos):
+            titulo = f"Parcelamento SISPAR {idx + 1 if len(parcelamentos) > 1 else ''}"
+            _add_heading(doc, titulo)
+            
+            # Informações básicas extraídas do PDF, dirigidas por
+            # _SISPAR_FIELDS e emitidas numa única chamada em lote
+            linhas_parc = []
+            conta = parc.get("conta")
+            if conta:
                 tipo = parc.get("tipo")
-                if conta:
-                    if tipo:
-                        _add_paragrafo(doc, f"Conta: {conta} {tipo}")
-                    else:
-                        _add_paragrafo(doc, f"Conta: {conta}")
-                
-                modalidade = parc.get("modalidade")
-                if modalidade:
-                    _add_paragrafo(doc, f"Modalidade: {modalidade}")
-                
-                regime = parc.get("regime")
-                if regime:
-                    _add_paragrafo(doc, f"Regime: {regime}")
-                
-                limite = parc.get("limite_maximo_meses")
-                if limite:
-                    _add_paragrafo(doc, f"Limite máximo: ATÉ {limite} MESES")
-                
-                negociado = parc.get("negociado_no_sispar")
-                if negociado is not None:
-                    _add_paragrafo(doc, f"Negociado no SISPAR: {'SIM' if negociado else 'NÃO'}")
-                
-                exigibilidade = parc.get("exigibilidade_suspensa")
-                if exigibilidade is not None:
-                    _add_paragrafo(doc, f"Exigibilidade suspensa: {'SIM' if exigibilidade else 'NÃO'}")
-                
-                doc.add_paragraph("")
-                
-                # Informações preenchidas manualmente (se houver)
-                qtd_parcelas = parc.get("quantidade_parcelas")
-                valor_total = parc.get("valor_total_parcelado")
-                valor_parcela = parc.get("valor_parcela")
-                competencias = parc.get("competencias", [])
+                linhas_parc.append(f"Conta: {conta} {tipo}" if tipo else f"Conta: {conta}")
+
+            for chave, rotulo, fmt, emite_falso in _SISPAR_FIELDS:
+                v = parc.get(chave)
+                if (v is not None) if emite_falso else v:
+                    linhas_parc.append(f"{rotulo}: {fmt(v) if fmt else v}")
+
+            _add_paragrafos_bulk(doc, linhas_parc)
+            doc.add_paragraph("")
+            
+            # Informações preenchidas manualmente (se houver)
+            qtd_parcelas = parc.get("quantidade_parcelas")
+            valor_total = parc.get("valor_total_parcelado")
+            valor_parcela = parc.get("valor_parcela")
+            competencias = parc.get("competencias", [])
+            
+            if qtd_parcelas or valor_total or valor_parcela or competencias:
+                add_p("Informações preenchidas manualmente:")
                 
-                if qtd_parcelas or valor_total or valor_parcela or competencias:
-                    _add_paragrafo(doc, "Informações preenchidas manualmente:")
-                    
-                    if qtd_parcelas:
-                        _add_paragrafo(doc, f"Quantidade de parcelas: {qtd_parcelas}")
-                    if valor_total:
-                        _add_paragrafo(doc, f"Valor total parcelado: {valor_total}")
-                    if valor_parcela:
-                        _add_paragrafo(doc, f"Valor da parcela: {valor_parcela}")
-                    if competencias:
-                        comps_str = ", ".join(competencias)
-                        _add_paragrafo(doc, f"Competências: {comps_str}")
-                    
-                    _add_paragrafo(doc, "Status: INFORMADO PELO USUÁRIO")
-                else:
-                    # Observação de necessidade de consulta manual
-                    observacao = parc.get("observacao", "O relatório da Receita Federal não informa quantidade de parcelas, valores ou competências; é necessária consulta manual ao PGFN/SISPAR.")
-                    _add_paragrafo(doc, f"Observação: {observacao}")
-                    _add_paragrafo(doc, "Status: NECESSITA CONSULTA MANUAL")
+                if qtd_parcelas:
+                    add_p(f"Quantidade de parcelas: {qtd_parcelas}")
+                if valor_total:
+                    add_p(f"Valor total parcelado: {valor_total}")
+                if valor_parcela:
+                    add_p(f"Valor da parcela: {valor_parcela}")
+                if competencias:
+                    comps_str = ", ".join(competencias)
+                    add_p(f"Competências: {comps_str}")
                 
-                doc.add_paragraph("")
+                add_p("Status: INFORMADO PELO USUÁRIO")
+            else:
+                # Observação de necessidade de consulta manual
+                observacao = parc.get("observacao", "O relatório da Receita Federal não informa quantidade de parcelas, valores ou competências; é necessária consulta manual ao PGFN/SISPAR.")
+                add_p(f"Observação: {observacao}")
+                add_p("Status: NECESSITA CONSULTA MANUAL")
+            
+            doc.add_paragraph("")
     
     # Parcelamentos manuais
-    parcelamentos_rows = dados.get("parcelamentos_rows") or []
+    parcelamentos_rows = get("parcelamentos_rows") or []
     if parcelamentos_rows:
         _add_heading(doc, "Outros Parcelamentos")
         _add_table(
@@ -441,39 +578,73 @@ def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
             ],
             parcelamentos_rows,
         )
-    elif not ("receita_federal" in dados and dados["receita_federal"] and dados["receita_federal"].get("sispar", {}).get("tem_sispar")):
-        _add_paragrafo(doc, "Não há parcelamentos informados.")
+    elif not sispar.get("tem_sispar"):
+        add_p("Não há parcelamentos informados.")
     
     # Parcelamentos ativos
-    manual_parc = dados.get("parcelamentos_ativos", {}).get("texto_manual", "").strip()
+    manual_parc = get("parcelamentos_ativos", {}).get("texto_manual", "").strip()
     if manual_parc:
-        _add_paragrafo(doc, "Parcelamentos ativos:")
-        for linha in manual_parc.split("\n"):
-            if linha.strip():
-                _add_paragrafo(doc, linha.strip())
+        add_p("Parcelamentos ativos:")
+        _add_paragrafos_bulk(doc, map(str.strip, manual_parc.splitlines()))
     else:
-        _add_paragrafo(doc, "Parcelamentos ativos: (não informado)")
+        add_p("Parcelamentos ativos: (não informado)")
     doc.add_paragraph("")
     
     # ============================= CONCLUSÃO ==========================
 
     _add_heading(doc, "CONCLUSÃO")
-    for linha in dados.get("bloco_conclusao", "").split("\n"):
-        if linha.strip():
-            _add_paragrafo(doc, linha.strip())
+    _add_paragrafos_bulk(doc, map(str.strip, get("bloco_conclusao", "").splitlines()))
     doc.add_paragraph("")
 
-    _add_paragrafo(doc, "Eikon Soluções Ltda CNPJ: 09.502.539/0001-13")
+    add_p(_EIKON_FOOTER)
     doc.add_paragraph("")
-    _add_paragrafo(doc, "Atenciosamente,")
+    add_p(_ATENCIOSAMENTE)
     doc.add_paragraph("")
-    _add_paragrafo(doc, dados.get("responsavel_nome", ""))
-    _add_paragrafo(doc, dados.get("responsavel_cargo", ""))
-    _add_paragrafo(doc, f"e-mail: {dados.get('responsavel_email', '')}")
+    _add_paragrafos_bulk(doc, (
+        get("responsavel_nome", ""),
+        get("responsavel_cargo", ""),
+        f"e-mail: {get('responsavel_email', '')}",
+    ))
 
-    # ========================= SAÍDA EM MEMÓRIA =======================
+    return doc
 
+
+def gerar_docx_bytes(dados: Dict[str, Any]) -> bytes:
+    """
+    Gera o arquivo .docx em memória a partir do dicionário 'dados'.
+    Retorna os bytes do arquivo para uso no st.download_button.
+    """
     buffer = io.BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
+    _montar_documento(dados).save(buffer)
+    # getvalue() evita a cópia extra do par seek(0) + read()
+    return buffer.getvalue()
+
+
+def gerar_docx_stream(dados: Dict[str, Any], destino) -> None:
+    """
+    Grava o .docx diretamente em um destino arquivo-like (ex.: corpo de
+    resposta HTTP), sem materializar os bytes intermediários.
+    """
+    _montar_documento(dados).save(destino)
+
+
+def gerar_docx_bytes_batch(dados_list: List[Dict[str, Any]], workers: int = None) -> List[bytes]:
+    """
+    Gera vários relatórios .docx em paralelo, um processo por relatório.
+
+    A geração é independente por 'dados' (dicionário picklável) e o lxml
+    solta o GIL na serialização, então lotes escalam quase linearmente até
+    o número de CPUs. Lotes de até um item (ou workers=1) nem pagam o
+    custo de fork/pickle e são gerados em série.
+
+    Args:
+        dados_list: Lista de dicionários 'dados' (mesmo formato de gerar_docx_bytes)
+        workers: Número de processos (None usa o padrão do executor, ~CPUs)
+
+    Returns:
+        Lista de bytes dos arquivos, na mesma ordem de dados_list
+    """
+    if len(dados_list) <= 1 or workers == 1:
+        return [gerar_docx_bytes(d) for d in dados_list]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(gerar_docx_bytes, dados_list))
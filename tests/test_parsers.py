@@ -1,96 +1,110 @@
 # tests/test_parsers.py
 """
-Testes unitários para os parsers (SEFAZ, Receita/PGFN).
+Testes para os parsers (SEFAZ, Receita/PGFN) e utilitários, em estilo pytest.
 Garante que nunca retornem situacao=None e que detectem corretamente REGULAR/IRREGULAR/INDETERMINADO.
 """
 
-import unittest
+import pytest
+
 from src.parsers.sefaz import processar_sefaz
 from src.parsers.receita_federal import processar_receita
-from src.utils import safe_str, normalize_text
-
-
-class TestSEFAZParser(unittest.TestCase):
-    """Testes para o parser SEFAZ."""
-    
-    def test_sefaz_irregularidades(self):
-        """Testa detecção de IRREGULARIDADES."""
-        texto = "O documento contém IRREGULARIDADES fiscais. Há débitos pendentes."
-        tabelas = []
-        resultado = processar_sefaz(texto, tabelas)
-        
-        self.assertEqual(resultado['situacao'], 'IRREGULAR')
-        self.assertIsNotNone(resultado['situacao'])
-        self.assertIn('irregularidades', resultado['motivos'][0].lower())
-    
-    def test_sefaz_regularidade(self):
-        """Testa detecção de REGULARIDADE."""
-        texto = "CERTIDÃO DE REGULARIDADE FISCAL. Situação REGULAR. Nada consta."
-        tabelas = []
-        resultado = processar_sefaz(texto, tabelas)
-        
-        self.assertEqual(resultado['situacao'], 'REGULAR')
-        self.assertIsNotNone(resultado['situacao'])
-    
-    def test_sefaz_indeterminado(self):
-        """Testa retorno INDETERMINADO quando não há match."""
-        texto = "Documento genérico sem informações claras sobre situação fiscal."
-        tabelas = []
-        resultado = processar_sefaz(texto, tabelas)
-        
-        self.assertEqual(resultado['situacao'], 'INDETERMINADO')
-        self.assertIsNotNone(resultado['situacao'])
-        self.assertIn('não corresponde', resultado['motivos'][0].lower())
-
-
-class TestReceitaParser(unittest.TestCase):
-    """Testes para o parser Receita/PGFN."""
-    
-    def test_receita_siefpar_atraso(self):
-        """Testa detecção de SIEFPAR com parcelas em atraso."""
-        texto = """
-        Pendência - Parcelamento (SIEFPAR)
-        Parcelas em Atraso: 1
-        Valor em Atraso: 571,90
-        """
-        resultado = processar_receita(texto, [])
-        
-        # Verifica que detectou parcelamento
-        self.assertTrue(resultado['simples_nacional']['parcelamento']['tem_parcelamento'])
-        self.assertEqual(resultado['simples_nacional']['parcelamento']['parcelas_atraso'], 1)
-        self.assertAlmostEqual(resultado['simples_nacional']['parcelamento'].get('valor_atraso', 0), 571.90, places=2)
-        self.assertTrue(resultado['simples_nacional']['tem_debito_em_aberto'])
-    
-    def test_receita_sem_atraso(self):
-        """Testa caso sem atraso (REGULAR)."""
-        texto = "Não foram detectadas pendências. Situação regular."
-        resultado = processar_receita(texto, [])
-        
-        # Não deve ter débitos em aberto
-        self.assertFalse(resultado['simples_nacional']['tem_debito_em_aberto'])
-
-
-class TestUtils(unittest.TestCase):
-    """Testes para funções utilitárias."""
-    
-    def test_safe_str_none(self):
-        """Testa safe_str com None."""
-        self.assertEqual(safe_str(None), "")
-        self.assertEqual(safe_str(""), "")
-    
-    def test_safe_str_valor(self):
-        """Testa safe_str com valores."""
-        self.assertEqual(safe_str("teste"), "teste")
-        self.assertEqual(safe_str(123), "123")
-    
-    def test_normalize_text(self):
-        """Testa normalize_text."""
-        texto = "  Teste   com   espaços  \n\n\n múltiplos  "
-        resultado = normalize_text(texto)
-        self.assertNotIn("   ", resultado)  # Não deve ter espaços triplos
-        self.assertIn("Teste", resultado)
-
-
-if __name__ == '__main__':
-    unittest.main()
+from src.utils import safe_str, normalize_text, formatar_moeda_br
+
+
+# ============================== SEFAZ ==============================
+
+@pytest.mark.parametrize(
+    "texto,situacao,motivo_substr",
+    [
+        # Detecção de IRREGULARIDADES
+        (
+            "O documento contém IRREGULARIDADES fiscais. Há débitos pendentes.",
+            "IRREGULAR",
+            "irregularidades",
+        ),
+        # Detecção de REGULARIDADE
+        (
+            "CERTIDÃO DE REGULARIDADE FISCAL. Situação REGULAR. Nada consta.",
+            "REGULAR",
+            None,
+        ),
+        # Sem match -> INDETERMINADO
+        (
+            "Documento genérico sem informações claras sobre situação fiscal.",
+            "INDETERMINADO",
+            "não corresponde",
+        ),
+    ],
+)
+def test_sefaz_situacao(texto, situacao, motivo_substr):
+    """Testa a classificação de situação do parser SEFAZ."""
+    resultado = processar_sefaz(texto, [])
+
+    assert resultado['situacao'] == situacao
+    assert resultado['situacao'] is not None
+    if motivo_substr is not None:
+        assert motivo_substr in resultado['motivos'][0].lower()
+
+
+# ========================= RECEITA / PGFN ==========================
+
+def test_receita_siefpar_atraso():
+    """Testa detecção de SIEFPAR com parcelas em atraso."""
+    texto = """
+    Pendência - Parcelamento (SIEFPAR)
+    Parcelas em Atraso: 1
+    Valor em Atraso: 571,90
+    """
+    resultado = processar_receita(texto, [])
+
+    # Verifica que detectou parcelamento
+    assert resultado['simples_nacional']['parcelamento']['tem_parcelamento']
+    assert resultado['simples_nacional']['parcelamento']['parcelas_atraso'] == 1
+    assert resultado['simples_nacional']['parcelamento'].get('valor_atraso', 0) == pytest.approx(571.90, abs=1e-2)
+    assert resultado['simples_nacional']['tem_debito_em_aberto']
+
+
+def test_receita_sem_atraso():
+    """Testa caso sem atraso (REGULAR)."""
+    texto = "Não foram detectadas pendências. Situação regular."
+    resultado = processar_receita(texto, [])
+
+    # Não deve ter débitos em aberto
+    assert not resultado['simples_nacional']['tem_debito_em_aberto']
+
+
+# ============================ UTILITÁRIOS ==========================
+
+@pytest.mark.parametrize(
+    "entrada,esperado",
+    [
+        (None, ""),
+        ("", ""),
+        ("teste", "teste"),
+        (123, "123"),
+    ],
+)
+def test_safe_str(entrada, esperado):
+    """Testa safe_str com None e valores comuns."""
+    assert safe_str(entrada) == esperado
+
+
+@pytest.mark.parametrize(
+    "valor,esperado",
+    [
+        (1234567.89, "R$ 1.234.567,89"),
+        (1000.0, "R$ 1.000,00"),
+        (0.0, "R$ 0,00"),
+    ],
+)
+def test_formatar_moeda_br(valor, esperado):
+    """Testa a troca atômica de separadores (milhar/decimal) pt-BR."""
+    assert formatar_moeda_br(valor) == esperado
+
 
+def test_normalize_text():
+    """Testa normalize_text."""
+    texto = "  Teste   com   espaços  \n\n\n múltiplos  "
+    resultado = normalize_text(texto)
+    assert "   " not in resultado  # Não deve ter espaços triplos
+    assert "Teste" in resultado